@@ -0,0 +1,637 @@
+"""
+Inactive Product -> Active Promotion Audit
+==========================================
+Answers use case 10 from use_case.txt: are any inactive products still part
+of active promotions?
+
+Three stages, following the traversal rules in rules.md:
+  1. Inactive products — every PRODUCTVOD whose current version has
+     ACTIVE_FLAG = 'N'.
+  2. Ancestors — level-by-level upward walk from the inactive seed set,
+     checking BOTH parent paths at every level (direct product relationship
+     and relationship-domain entry), deduplicating against already-seen
+     products to stay cycle-safe.
+  3. Promotion usage — the combined product set from stages 1 and 2 is
+     checked against all active promotions across the three documented
+     promotion paths (ProductDefinition bridge, direct promotion item,
+     promotion item domain).
+
+Results are printed as JSON, one document per stage.
+
+Usage:
+    python3 inactive_promotion_audit.py \\
+        --config config.json \\
+        --graph  product_graph \\
+        --hops   5
+
+Expected config.json keys:
+    26AI_USER, 26AI_PASSWORD, 26AI_DSN,
+    26AI_CONFIG_DIR, 26AI_WALLET_LOCATION, 26AI_WALLET_PASSWORD
+"""
+
+import argparse
+import functools
+import json
+import logging
+import shelve
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, List
+
+import oracledb
+
+# orjson (Rust/SIMD JSON parser) parses config files faster than stdlib
+# json. Optional — fall back to json when not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SCRIPT_DIR = Path(__file__).parent
+
+# ── Logging ───────────────────────────────────────────────────────────────────
+
+logging.basicConfig(
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    level=logging.INFO,
+    handlers=[logging.StreamHandler()],
+)
+log = logging.getLogger(__name__)
+
+
+# ── Config & connection ───────────────────────────────────────────────────────
+
+def resolve_path(path_value: str) -> Path:
+    """
+    Resolve a path string to an absolute Path.
+
+    If the given path is already absolute, it is returned as-is.
+    If it is relative, it is resolved relative to the directory containing
+    this script (SCRIPT_DIR), not the current working directory.
+
+    Parameters:
+        path_value : A path string (relative or absolute).
+
+    Returns:
+        An absolute Path object.
+    """
+    path = Path(path_value)
+    if not path.is_absolute():
+        path = (SCRIPT_DIR / path).resolve()
+    return path
+
+
+_pool = None
+
+
+def _get_pool(config_path: Path):
+    """
+    Lazily create the module-level Oracle connection pool.
+
+    Pool parameters:
+        min  = 2 — two connections kept warm across repeated audits
+        max  = 5 — hard ceiling; callers block if all are in use
+        increment = 1 — grow by one connection at a time under load
+
+    stmtcachesize is kept high so the per-hop GRAPH_TABLE statements stay
+    soft-parsed across acquisitions; ping_interval revalidates idle
+    connections so long-lived processes (cron, MCP) never hand out a dead
+    session.
+    """
+    global _pool
+    if _pool is None:
+        data = config_path.read_bytes()
+        cfg = orjson.loads(data) if orjson is not None else json.loads(data)
+        log.info("Initialising Oracle connection pool (min=2, max=5) ...")
+        _pool = oracledb.create_pool(
+            user            = cfg["26AI_USER"],
+            password        = cfg["26AI_PASSWORD"],
+            dsn             = cfg["26AI_DSN"],
+            config_dir      = cfg["26AI_CONFIG_DIR"],
+            wallet_location = cfg["26AI_WALLET_LOCATION"],
+            wallet_password = cfg["26AI_WALLET_PASSWORD"],
+            min             = 2,
+            max             = 5,
+            increment       = 1,
+            ping_interval   = 60,
+            stmtcachesize   = 50,
+        )
+        log.info("Connection pool ready.")
+    return _pool
+
+
+def get_conn(config_path: Path):
+    """
+    Acquire a pooled thin-mode connection to the 26ai graph database.
+
+    Parameters:
+        config_path : Absolute path to the config JSON file.
+
+    Returns:
+        A pooled oracledb connection; close() releases it back to the pool
+        rather than tearing it down.
+    """
+    conn = _get_pool(config_path).acquire()
+    log.info(f"Acquired pooled connection to Oracle 26ai: {conn.version}")
+    return conn
+
+
+# ── Query helpers ─────────────────────────────────────────────────────────────
+
+def id_collection(conn, values: List[str]):
+    """
+    Build a SYS.ODCIVARCHAR2LIST bind object from a list of IDs.
+
+    Binding the IDs as a collection keeps the SQL text identical across
+    calls (soft parse, statement cache hit) and sidesteps the 1000-element
+    limit on literal IN-lists.
+
+    Parameters:
+        conn   : Active oracledb connection.
+        values : List of string IDs.
+
+    Returns:
+        An oracledb object usable as `TABLE(:ids)` in a query.
+    """
+    return conn.gettype("SYS.ODCIVARCHAR2LIST").newobject(list(values))
+
+
+def id_predicate(conn, values):
+    """
+    Build the SQL predicate and binds for matching a set of IDs.
+
+    Single-element sets are specialized to a scalar equality bind, which
+    lets the optimizer drive an index lookup directly instead of planning a
+    collection join; larger sets use the collection bind. Each variant has
+    a stable SQL text, so both stay soft-parsed in the statement cache.
+
+    Parameters:
+        conn   : Active oracledb connection.
+        values : Collection of string IDs (list, set or tuple).
+
+    Returns:
+        A (predicate_sql, params) pair to splice after the ID column.
+    """
+    if len(values) == 1:
+        return "= :id", {"id": next(iter(values))}
+    return "IN (SELECT COLUMN_VALUE FROM TABLE(:ids))", {"ids": id_collection(conn, values)}
+
+
+def tuned_cursor(conn):
+    """
+    Open a cursor with fetch sizes tuned for the audit queries.
+
+    arraysize/prefetchrows are sized so thousands of rows come back in few
+    network round trips. The audit reuses one cursor across all its
+    statements, which keeps the prepared-statement handle alive — combined
+    with the stable SQL texts, repeat executions skip re-parsing entirely.
+
+    Parameters:
+        conn : Active oracledb connection.
+
+    Returns:
+        A tuned oracledb cursor.
+    """
+    cur = conn.cursor()
+    cur.arraysize = 1000
+    cur.prefetchrows = 1001
+    return cur
+
+
+def run_query(cur, sql: str, params: Dict = None) -> List[tuple]:
+    """
+    Execute a SQL statement on the given cursor and return namedtuple rows.
+
+    The row class is built once per query from cur.description, so each row
+    is a single contiguous tuple with attribute access — no per-row dict or
+    hash-table overhead; callers needing dicts (JSON output) convert at the
+    boundary via row._asdict().
+
+    Parameters:
+        cur    : Cursor to execute on (see tuned_cursor).
+        sql    : The SQL text to execute.
+        params : Optional dict of bind variables.
+
+    Returns:
+        A list of namedtuple rows with one attribute per result column.
+    """
+    cur.execute(sql, params or {})
+    Row = namedtuple("Row", [d[0] for d in cur.description], rename=True)
+    return [Row._make(r) for r in cur]
+
+
+# ── Stage 1: inactive products ────────────────────────────────────────────────
+
+def fetch_inactive_products(cur, graph: str) -> List[Dict]:
+    """
+    Find all products that are inactive in their current version.
+
+    Parameters:
+        conn  : Active oracledb connection.
+        graph : Name of the property graph to query.
+
+    Returns:
+        A list of dicts with PRODUCT_NAME, OBJECT_NUMBER and VERSION_NUMBER.
+    """
+    sql = f"""
+        SELECT gt.PRODUCT_NAME,
+               gt.OBJECT_NUMBER,
+               gt.VERSION_NUMBER
+        FROM GRAPH_TABLE("{graph}"
+          MATCH (p IS PRODUCTVOD)-[IS PRODUCTVOD_HAS_VERSION_VODVERSION]->(ver IS VODVERSION)
+          WHERE ver.CURRENT_VERSION_FLAG = 'Y'
+            AND ver.ACTIVE_FLAG = 'N'
+          COLUMNS (
+            p.VOD_NAME AS PRODUCT_NAME,
+            p.OBJECT_NUMBER AS OBJECT_NUMBER,
+            ver.VERSION_NUMBER AS VERSION_NUMBER
+          )
+        ) gt
+    """
+    rows = [row._asdict() for row in run_query(cur, sql)]
+    rows.sort(key=lambda r: str(r["PRODUCT_NAME"]))
+    return rows
+
+
+# ── Stage 2: ancestor traversal ───────────────────────────────────────────────
+
+def fetch_parents(cur, graph: str, child_object_numbers) -> set:
+    """
+    Fetch the direct parents of a set of products, one level up.
+
+    Both documented parent paths are checked in a single statement (rules.md
+    requires both at every level):
+      - Path A: direct product relationship — OBJECTRELATIONSHIP with
+        SUB_OBJECT_TYPE_CODE = 'Product' pointing at the child.
+      - Path B: relationship domain entry — OBJECTRELATIONSHIPDOMAIN under a
+        'Port'/'DynPort' relationship pointing at the child.
+
+    Parameters:
+        cur                  : Cursor to execute on (see tuned_cursor).
+        graph                : Name of the property graph to query.
+        child_object_numbers : OBJECT_NUMBER values of the current frontier.
+
+    Returns:
+        A set of distinct parent OBJECT_NUMBER values.
+    """
+    pred, params = id_predicate(cur.connection, child_object_numbers)
+    sql = _parents_sql(graph, pred)
+    return {row.PARENT_OBJECT_NUMBER for row in run_query(cur, sql, params)}
+
+
+@functools.lru_cache(maxsize=None)
+def _parents_sql(graph: str, pred: str) -> str:
+    """
+    Render (and cache) the parent-walk SQL for one graph / predicate shape.
+
+    The graph name is an identifier inside GRAPH_TABLE and cannot be bound,
+    so the text is formatted once per (graph, predicate) pair and reused
+    across hops — only the :ids/:id binds vary between executions, keeping
+    one stable statement in the library cache.
+
+    SQL/PGQ does not allow subqueries inside the MATCH ... WHERE, so the
+    child key is exposed as a column and the bind predicate is applied in
+    the outer query; Oracle pushes it into the graph scan.
+    """
+    return f"""
+        SELECT DISTINCT parent.PARENT_OBJECT_NUMBER
+        FROM (
+          -- Path A: direct product relationship
+          SELECT gt.PARENT_OBJECT_NUMBER
+          FROM GRAPH_TABLE("{graph}"
+                MATCH (p IS PRODUCTVOD)-[IS PRODUCTVOD_HAS_VERSION_VODVERSION]->(pver IS VODVERSION),
+                      (p)-[IS PRODUCTVOD_HAS_RELATIONSHIP_OBJECTRELATIONSHIP]->(rel IS OBJECTRELATIONSHIP)
+                WHERE pver.CURRENT_VERSION_FLAG = 'Y'
+                  AND rel.SUB_OBJECT_TYPE_CODE = 'Product'
+                COLUMNS (
+                  p.OBJECT_NUMBER AS PARENT_OBJECT_NUMBER,
+                  rel.SUB_OBJECT_PRODUCT_ID AS CHILD_OBJECT_NUMBER
+                )
+               ) gt
+          WHERE gt.CHILD_OBJECT_NUMBER {pred}
+          UNION ALL
+          -- Path B: relationship domain entry
+          SELECT gt.PARENT_OBJECT_NUMBER
+          FROM GRAPH_TABLE("{graph}"
+                MATCH (p IS PRODUCTVOD)-[IS PRODUCTVOD_HAS_VERSION_VODVERSION]->(pver IS VODVERSION),
+                      (p)-[IS PRODUCTVOD_HAS_RELATIONSHIP_OBJECTRELATIONSHIP]->(rel IS OBJECTRELATIONSHIP),
+                      (rel)-[IS OBJECTRELATIONSHIP_HAS_RELATIONSHIP_DOMAIN_OBJECTRELATIONSHIPDOMAIN]->(d IS OBJECTRELATIONSHIPDOMAIN)
+                WHERE pver.CURRENT_VERSION_FLAG = 'Y'
+                  AND rel.SUB_OBJECT_TYPE_CODE IN ('Port','DynPort')
+                COLUMNS (
+                  p.OBJECT_NUMBER AS PARENT_OBJECT_NUMBER,
+                  d.SUB_OBJECT_PRODUCT_ID AS CHILD_OBJECT_NUMBER
+                )
+               ) gt
+          WHERE gt.CHILD_OBJECT_NUMBER {pred}
+        ) parent
+    """
+
+
+# ── Stage 3: promotion usage ──────────────────────────────────────────────────
+
+def fetch_promotion_usage(cur, graph: str, object_numbers: List[str]) -> List[Dict]:
+    """
+    Check which of the given products appear in active promotions.
+
+    All three documented promotion paths are checked (rules.md requires
+    combining them — never assume one path is sufficient):
+      - PRODUCT_ID_TO_PRODUCTDEFINITION : promotion item -> ProductDefinition
+        bridge -> product.
+      - PROMOTIONITEM_DIRECT            : promotion item points directly at
+        the product.
+      - SUB_OBJECT_VOD_NUMBER           : product appears as a domain entry
+        of a promotion item.
+
+    A product reachable through several paths is reported once, keeping the
+    highest-priority USED_VIA (bridge > direct > domain); the winner is
+    picked server-side with ROW_NUMBER over a priority column, so the three
+    path blocks combine with UNION ALL and no client-side dedup pass is
+    needed.
+
+    Parameters:
+        cur            : Cursor to execute on (see tuned_cursor).
+        graph          : Name of the property graph to query.
+        object_numbers : OBJECT_NUMBER values of the products to check.
+
+    Returns:
+        A list of dicts with PROMO_NAME, PROMO_ROW_ID, USED_VIA,
+        USED_PRODUCT_OBJECT_NUMBER and USED_PRODUCT_NAME, deduplicated per
+        (promotion, product). Names ride along in the same statement — the
+        bridge path prefers the ProductDefinition name — so no separate
+        name lookup is needed.
+    """
+    pred, params = id_predicate(cur.connection, object_numbers)
+    sql = _usage_sql(graph, pred)
+    rows = [row._asdict() for row in run_query(cur, sql, params)]
+    rows.sort(key=lambda r: (str(r["PROMO_NAME"]), str(r["USED_PRODUCT_OBJECT_NUMBER"])))
+    return rows
+
+
+@functools.lru_cache(maxsize=None)
+def _usage_sql(graph: str, pred: str) -> str:
+    """
+    Render (and cache) the promotion-usage SQL for one graph / predicate
+    shape; see _parents_sql for why the graph name is formatted, not bound.
+    """
+    return f"""
+        SELECT PROMO_NAME,
+               PROMO_ROW_ID,
+               USED_VIA,
+               USED_PRODUCT_OBJECT_NUMBER,
+               USED_PRODUCT_NAME
+        FROM (
+          SELECT prom.*,
+                 ROW_NUMBER() OVER (
+                   PARTITION BY prom.PROMO_ROW_ID, prom.USED_PRODUCT_OBJECT_NUMBER
+                   ORDER BY prom.PRIO
+                 ) AS RN
+          FROM (
+          -- Path: promotion item -> ProductDefinition bridge -> product
+          SELECT gt.PROMO_NAME,
+                 gt.PROMO_ROW_ID,
+                 'PRODUCT_ID_TO_PRODUCTDEFINITION' AS USED_VIA,
+                 1 AS PRIO,
+                 gt.USED_PRODUCT_OBJECT_NUMBER,
+                 gt.USED_PRODUCT_NAME
+          FROM GRAPH_TABLE("{graph}"
+                MATCH (pd IS PROMOTIONDEFINITION)
+                      -[IS PROMOTIONDEFINITION_HAS_ITEMS_PROMOTIONITEM]->(item IS PROMOTIONITEM),
+                      (item)-[IS PROMOTIONITEM_REFERS_TO_PRODUCTDEFINITION]->(pdef IS PRODUCTDEFINITION),
+                      (prod IS PRODUCTVOD)-[IS PRODUCTVOD_HAS_DEFINITION_PRODUCTDEFINITION]->(pdef)
+                WHERE pd.ACTIVE_FLAG = 'Y'
+                COLUMNS (
+                  pd.NAME AS PROMO_NAME,
+                  pd.ROW_ID AS PROMO_ROW_ID,
+                  prod.OBJECT_NUMBER AS USED_PRODUCT_OBJECT_NUMBER,
+                  COALESCE(pdef.NAME, prod.VOD_NAME) AS USED_PRODUCT_NAME
+                )
+               ) gt
+          WHERE gt.USED_PRODUCT_OBJECT_NUMBER {pred}
+          UNION ALL
+          -- Path: promotion item points directly at the product
+          SELECT gt.PROMO_NAME,
+                 gt.PROMO_ROW_ID,
+                 'PROMOTIONITEM_DIRECT' AS USED_VIA,
+                 2 AS PRIO,
+                 gt.USED_PRODUCT_OBJECT_NUMBER,
+                 gt.USED_PRODUCT_NAME
+          FROM GRAPH_TABLE("{graph}"
+                MATCH (pd IS PROMOTIONDEFINITION)
+                      -[IS PROMOTIONDEFINITION_HAS_ITEMS_PROMOTIONITEM]->(item IS PROMOTIONITEM),
+                      (item)-[IS PROMOTIONITEM_POINTS_TO_PRODUCTVOD]->(prod IS PRODUCTVOD)
+                WHERE pd.ACTIVE_FLAG = 'Y'
+                COLUMNS (
+                  pd.NAME AS PROMO_NAME,
+                  pd.ROW_ID AS PROMO_ROW_ID,
+                  prod.OBJECT_NUMBER AS USED_PRODUCT_OBJECT_NUMBER,
+                  prod.VOD_NAME AS USED_PRODUCT_NAME
+                )
+               ) gt
+          WHERE gt.USED_PRODUCT_OBJECT_NUMBER {pred}
+          UNION ALL
+          -- Path: product appears as a domain entry of a promotion item
+          SELECT gt.PROMO_NAME,
+                 gt.PROMO_ROW_ID,
+                 'SUB_OBJECT_VOD_NUMBER' AS USED_VIA,
+                 3 AS PRIO,
+                 gt.USED_PRODUCT_OBJECT_NUMBER,
+                 gt.USED_PRODUCT_NAME
+          FROM GRAPH_TABLE("{graph}"
+                MATCH (pd IS PROMOTIONDEFINITION)
+                      -[IS PROMOTIONDEFINITION_HAS_ITEMS_PROMOTIONITEM]->(item IS PROMOTIONITEM),
+                      (item)-[IS PROMOTIONITEM_DOMAIN_PRODUCTVOD]->(prod IS PRODUCTVOD)
+                WHERE pd.ACTIVE_FLAG = 'Y'
+                COLUMNS (
+                  pd.NAME AS PROMO_NAME,
+                  pd.ROW_ID AS PROMO_ROW_ID,
+                  prod.OBJECT_NUMBER AS USED_PRODUCT_OBJECT_NUMBER,
+                  prod.VOD_NAME AS USED_PRODUCT_NAME
+                )
+               ) gt
+          WHERE gt.USED_PRODUCT_OBJECT_NUMBER {pred}
+          ) prom
+        )
+        WHERE RN = 1
+    """
+
+
+# Product names change far more slowly than promotions, so lookups are
+# memoized in a shelve sidecar next to the script and refreshed after a TTL.
+_NAME_CACHE_PATH = SCRIPT_DIR / "inactive_promotion_audit.names.db"
+_NAME_CACHE_TTL  = 24 * 3600  # seconds
+
+
+def fetch_product_names(cur, graph: str, object_numbers: List[str]) -> Dict[str, str]:
+    """
+    Map product OBJECT_NUMBERs to their display names.
+
+    Names are served from a disk-backed cache when fresh (see
+    _NAME_CACHE_TTL); only unknown or expired OBJECT_NUMBERs hit the
+    database, so steady-state audit runs skip this round trip entirely.
+
+    Parameters:
+        cur            : Cursor to execute on (see tuned_cursor).
+        graph          : Name of the property graph to query.
+        object_numbers : OBJECT_NUMBER values to look up.
+
+    Returns:
+        A dict mapping OBJECT_NUMBER -> VOD_NAME.
+    """
+    now = time.time()
+    names: Dict[str, str] = {}
+    with shelve.open(str(_NAME_CACHE_PATH)) as cache:
+        missing = []
+        for o in object_numbers:
+            entry = cache.get(o)
+            if entry is not None and now - entry[0] < _NAME_CACHE_TTL:
+                names[o] = entry[1]
+            else:
+                missing.append(o)
+
+        if missing:
+            log.info(f"  Name cache: {len(names)} hit(s), {len(missing)} miss(es).")
+            pred, params = id_predicate(cur.connection, missing)
+            for row in run_query(cur, _names_sql(graph, pred), params):
+                names[row.OBJECT_NUMBER] = row.PRODUCT_NAME
+                cache[row.OBJECT_NUMBER] = (now, row.PRODUCT_NAME)
+    return names
+
+
+@functools.lru_cache(maxsize=None)
+def _names_sql(graph: str, pred: str) -> str:
+    """
+    Render (and cache) the product-name lookup SQL for one graph /
+    predicate shape; see _parents_sql for why the graph name is formatted,
+    not bound.
+    """
+    return f"""
+        SELECT DISTINCT gt.OBJECT_NUMBER,
+                        gt.PRODUCT_NAME
+        FROM GRAPH_TABLE("{graph}"
+              MATCH (p IS PRODUCTVOD)
+              COLUMNS (
+                p.OBJECT_NUMBER AS OBJECT_NUMBER,
+                p.VOD_NAME AS PRODUCT_NAME
+              )
+             ) gt
+        WHERE gt.OBJECT_NUMBER {pred}
+    """
+
+
+# ── CLI entry point ───────────────────────────────────────────────────────────
+
+def _emit(obj: Dict) -> None:
+    """
+    Serialize one result document straight to stdout.
+
+    json.dump streams into the stdout buffer instead of building the whole
+    document as an intermediate str first — for large ancestor or usage
+    sets that intermediate is the process's peak allocation.
+
+    Parameters:
+        obj : The JSON-serializable document to write.
+    """
+    json.dump(obj, sys.stdout, indent=2, default=str)
+    sys.stdout.write("\n")
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Define and parse command-line arguments for the audit.
+
+    Returns:
+        A Namespace with attributes:
+          config — path to the JSON config file
+          graph  — name of the property graph to audit
+          hops   — maximum number of ancestor levels to walk
+    """
+    parser = argparse.ArgumentParser(
+        description="Audit whether inactive products are part of active promotions"
+    )
+    parser.add_argument(
+        "--config",
+        default="config.json",
+        help="Path to the JSON config file (default: config.json)",
+    )
+    parser.add_argument(
+        "--graph",
+        default="product_graph",
+        help="Name of the property graph to audit (default: product_graph)",
+    )
+    parser.add_argument(
+        "--hops",
+        type=int,
+        default=5,
+        help="Maximum number of ancestor levels to walk (default: 5)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """
+    Run the three-stage inactive-promotion audit and print JSON results.
+
+    Stage 2 walks ancestors level by level: each level issues one query that
+    covers both parent paths for the whole frontier, newly found parents are
+    deduplicated against everything already seen (cycle safety per rules.md),
+    and the walk stops early once a level yields no new ancestors.
+    """
+    args        = parse_args()
+    config_path = resolve_path(args.config)
+    if not config_path.exists():
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+
+    conn = get_conn(config_path)
+    cur  = tuned_cursor(conn)
+    try:
+        # -- Stage 1: inactive products --------------------------------------
+        log.info("[STAGE 1] Fetching inactive products ...")
+        inactive = fetch_inactive_products(cur, args.graph)
+        log.info(f"  Found {len(inactive)} inactive product(s).")
+        _emit({"inactive_products": inactive})
+
+        if not inactive:
+            log.info("No inactive products — nothing to audit.")
+            return
+
+        # -- Stage 2: ancestor walk ------------------------------------------
+        log.info(f"[STAGE 2] Walking ancestors (max {args.hops} hop(s)) ...")
+        frontier  = {r["OBJECT_NUMBER"] for r in inactive}
+        all_nodes = set(frontier)
+        levels    = []
+        for hop in range(args.hops):
+            if not frontier:
+                break
+            new_parents = fetch_parents(cur, args.graph, frontier) - all_nodes
+            if not new_parents:
+                break
+            log.info(f"  Hop {hop + 1}: {len(new_parents)} new ancestor(s).")
+            levels.append(new_parents)
+            all_nodes |= new_parents
+            frontier = new_parents
+        _emit({"ancestor_levels": [sorted(l) for l in levels]})
+
+        # -- Stage 3: promotion usage ----------------------------------------
+        log.info("[STAGE 3] Checking active promotions ...")
+        targets     = sorted(all_nodes)
+        promo_usage = fetch_promotion_usage(cur, args.graph, targets)
+        log.info(f"  Found {len(promo_usage)} promotion usage row(s).")
+        _emit({"promotion_usage": promo_usage})
+
+        _emit({
+            "summary": {
+                "inactive_products": len(inactive),
+                "ancestors_found":   len(all_nodes) - len(inactive),
+                "promotion_hits":    len(promo_usage),
+            }
+        })
+    finally:
+        cur.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
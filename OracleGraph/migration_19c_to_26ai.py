@@ -49,6 +49,9 @@ Expected config.json keys:
     QUERY_DATE       (incremental cut-off date for LAST_UPD filter)
     DATE_FORMAT      (Oracle TO_DATE format string, e.g. 'YYYY-MM-DD')
     BATCH_SIZE       (number of rows per insert/merge chunk)
+    SOURCE_WORKERS   (parallel source-reader processes, default 1)
+    COMMIT_EVERY     (chunks per target commit, default 1)
+    USE_RESULT_CACHE (add /*+ RESULT_CACHE */ to source SELECTs, default false)
 
 Expected graph_model.json structure:
     {
@@ -77,12 +80,23 @@ Expected graph_model.json structure:
 """
 
 import argparse
+import datetime
+import decimal
 import json
 import logging
 import multiprocessing
+import os
 import oracledb
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# orjson (Rust/SIMD JSON parser) decodes straight from bytes and is several
+# times faster than stdlib json. Optional — fall back to json when not
+# installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 SCRIPT_DIR = Path(__file__).parent
 
@@ -90,6 +104,11 @@ SCRIPT_DIR = Path(__file__).parent
 # Tune via BATCH_SIZE in config.json.
 DEFAULT_CHUNK_SIZE = 10_000
 
+# Statement cache slots per connection. The default of 20 can evict the
+# per-node SELECT/MERGE statements on wide graph models, forcing re-parses;
+# 50 comfortably covers one statement per node plus the DDL block.
+STMT_CACHE_SIZE = 50
+
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -127,6 +146,32 @@ def resolve_path(path_value: str) -> Path:
     return path
 
 
+# Parsed JSON documents keyed by (path, mtime). A warm process re-running
+# main() skips the filesystem read and parse entirely; editing the file
+# changes its mtime and invalidates the entry naturally.
+_JSON_CACHE: Dict[Tuple[str, float], Dict] = {}
+
+
+def _load_json(path: Path) -> Dict:
+    """
+    Load and parse a JSON file, memoized by (path, mtime).
+
+    Parameters:
+        path : Absolute path to the JSON file.
+
+    Returns:
+        The parsed document. Callers share the cached object, so they must
+        treat it as read-only.
+    """
+    key  = (str(path), path.stat().st_mtime)
+    data = _JSON_CACHE.get(key)
+    if data is None:
+        raw  = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        _JSON_CACHE[key] = data
+    return data
+
+
 def load_config(config_path: Path) -> Dict:
     """
     Load the migration configuration from a JSON file.
@@ -137,8 +182,7 @@ def load_config(config_path: Path) -> Dict:
     Returns:
         A dict containing all config values (credentials, paths, batch settings).
     """
-    with config_path.open() as f:
-        return json.load(f)
+    return _load_json(config_path)
 
 
 # ---------------------------------------------------------------------------
@@ -154,6 +198,8 @@ def parse_args() -> argparse.Namespace:
           config      — path to the JSON config file
           graph_model — path to the graph model JSON (overrides config value)
           ddl_output  — path for the generated DDL SQL file (overrides config value)
+          yes         — run non-interactively (skip DROP, approve DDL + migration)
+          fresh       — first-run load: direct-path INSERT instead of MERGE
     """
     parser = argparse.ArgumentParser(
         description="Migrate schema and data from Oracle 19c to Oracle 26ai property graph"
@@ -173,6 +219,17 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Output path for generated 26ai schema SQL",
     )
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Run without prompts: skip the DROP step, apply DDL and migrate data",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="First-run load into empty tables: use direct-path "
+             "INSERT /*+ APPEND_VALUES */ instead of MERGE (no upsert)",
+    )
     return parser.parse_args()
 
 
@@ -180,48 +237,41 @@ def parse_args() -> argparse.Namespace:
 # DDL generation
 # ---------------------------------------------------------------------------
 
-def generate_ddl(graph_model: Dict) -> str:
+def iter_ddl(graph_model: Dict):
     """
-    Generate CREATE TABLE SQL statements for every node in the graph model.
+    Yield one CREATE TABLE statement per node in the graph model.
 
     For each node:
       - Creates one VARCHAR2(4000) column per property.
       - Adds a PRIMARY KEY constraint if the node has a 'ROW_ID' property.
 
+    Yielding block-by-block lets the caller stream DDL straight to the
+    output file, so only one statement is ever materialised at a time
+    instead of two full copies of the script (the block list plus its join).
+
     Parameters:
         graph_model : The full graph model dict with a "nodes" list.
 
-    Returns:
-        A single string containing all CREATE TABLE statements separated
-        by blank lines, ready to write to a SQL file or execute directly.
+    Yields:
+        One CREATE TABLE statement string (terminated by ';') per node.
     """
-    ddl_blocks = []
-
     for node in graph_model["nodes"]:
         table_name = node["name"]
         column_map = node["properties"]        # { display_alias: DB_column_name }
         pk_col     = column_map.get("ROW_ID")
-        columns    = [f"  {col} VARCHAR2(4000)" for col in column_map.values()]
 
-        lines = []
-        for i, col_def in enumerate(columns):
-            needs_comma = i < len(columns) - 1 or pk_col
-            lines.append(f"{col_def}{',' if needs_comma else ''}")
+        body = [f"  {col} VARCHAR2(4000)" for col in column_map.values()]
         if pk_col:
-            lines.append(f"  CONSTRAINT PK_{table_name} PRIMARY KEY ({pk_col})")
-
-        ddl_blocks.append(
-            f"CREATE TABLE {table_name} (\n" + "\n".join(lines) + "\n);"
-        )
+            body.append(f"  CONSTRAINT PK_{table_name} PRIMARY KEY ({pk_col})")
 
-    return "\n\n".join(ddl_blocks)
+        yield f"CREATE TABLE {table_name} (\n" + ",\n".join(body) + "\n);"
 
 
 # ---------------------------------------------------------------------------
 # SQL helpers
 # ---------------------------------------------------------------------------
 
-def parse_filter(filter_obj: Dict) -> str:
+def parse_filter(filter_obj: Dict, binds: Dict) -> str:
     """
     Recursively convert a structured filter dict into a SQL WHERE clause string.
 
@@ -229,6 +279,11 @@ def parse_filter(filter_obj: Dict) -> str:
     using named operators (gt, gte, lt, lte, ne, eq) or direct value equality.
     Also handles IS NULL / IS NOT NULL shorthand values.
 
+    Comparison values are never inlined into the SQL text. Each one becomes a
+    named bind variable (:f0, :f1, ...) collected into `binds`, so the same
+    SQL text is reused across runs (soft parse on the server) and filter
+    values cannot break out of the statement.
+
     Operator mapping:
         gt  -> >     gte -> >=
         lt  -> <     lte -> <=
@@ -236,19 +291,23 @@ def parse_filter(filter_obj: Dict) -> str:
 
     Examples:
         {"ACTIVE_FLG": "Y"}
-            -> "ACTIVE_FLG='Y'"
+            -> "ACTIVE_FLG = :f0"          binds = {"f0": "Y"}
 
         {"AND": [{"STATUS": {"ne": "D"}}, {"TYPE": "PROD"}]}
-            -> "(STATUS <> 'D' AND TYPE='PROD')"
+            -> "(STATUS <> :f0 AND TYPE = :f1)"
+                                           binds = {"f0": "D", "f1": "PROD"}
 
         {"LAST_UPD": "IS NOT NULL"}
-            -> "LAST_UPD IS NOT NULL"
+            -> "LAST_UPD IS NOT NULL"      (no bind created)
 
     Parameters:
         filter_obj : A dict following the structured filter schema.
+        binds      : Dict that accumulates bind values keyed by bind name.
+                     Mutated in place; pass a fresh dict at the top level.
 
     Returns:
-        A SQL WHERE clause fragment (without the WHERE keyword).
+        A SQL WHERE clause fragment (without the WHERE keyword) referencing
+        the bind names recorded in `binds`.
 
     Raises:
         ValueError : If filter_obj is not a dict, an unknown operator is used,
@@ -260,13 +319,22 @@ def parse_filter(filter_obj: Dict) -> str:
     op_map = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<=", "ne": "<>", "eq": "="}
     clauses = []
 
+    def bind(value) -> str:
+        """Register a bind value and return its :name placeholder."""
+        name = f"f{len(binds)}"
+        binds[name] = value
+        return f":{name}"
+
     for key, value in filter_obj.items():
         if key == "AND":
-            clauses.append(f"({' AND '.join(parse_filter(c) for c in value)})")
+            # List comprehensions, not generator expressions: join() over a
+            # generator re-enters the frame per element, which stacks up on
+            # the recursive path.
+            clauses.append(f"({' AND '.join([parse_filter(c, binds) for c in value])})")
         elif key == "OR":
-            clauses.append(f"({' OR '.join(parse_filter(c) for c in value)})")
+            clauses.append(f"({' OR '.join([parse_filter(c, binds) for c in value])})")
         elif key == "NOT":
-            clauses.append(f"(NOT {parse_filter(value)})")
+            clauses.append(f"(NOT {parse_filter(value, binds)})")
         elif isinstance(value, dict):
             for op, v in value.items():
                 if op not in op_map:
@@ -279,23 +347,79 @@ def parse_filter(filter_obj: Dict) -> str:
                     else:
                         raise ValueError(f"Cannot apply operator '{op}' against NULL")
                 else:
-                    v_str = f"'{v}'" if isinstance(v, str) else str(v)
-                    clauses.append(f"{key} {op_map[op]} {v_str}")
+                    clauses.append(f"{key} {op_map[op]} {bind(v)}")
         elif isinstance(value, str) and value.strip().upper() in ("IS NULL", "IS NOT NULL"):
             clauses.append(f"{key} {value.strip().upper()}")
         else:
-            v_str = f"'{value}'" if isinstance(value, str) else str(value)
-            clauses.append(f"{key}={v_str}")
+            clauses.append(f"{key} = {bind(value)}")
 
     return " AND ".join(clauses)
 
 
+# parse_filter results keyed by the filter's canonical JSON form. Many nodes
+# share identical filter structures (e.g. {"ACTIVE_FLG": "Y"}), so each
+# distinct structure is translated to SQL exactly once per run.
+_FILTER_CACHE: Dict[str, Tuple[str, Dict]] = {}
+
+
+def _cached_filter(filter_obj: Dict) -> Tuple[str, Dict]:
+    """
+    Content-cached front end for parse_filter().
+
+    Serializes the filter dict with sorted keys to form a stable cache key,
+    translating each distinct filter structure only once. Returns a fresh copy
+    of the binds dict so callers can safely add their own binds (e.g. the
+    incremental date cut-off) without polluting the cached entry.
+
+    Parameters:
+        filter_obj : A dict following the structured filter schema.
+
+    Returns:
+        A (clause, binds) tuple as produced by parse_filter().
+    """
+    key = json.dumps(filter_obj, sort_keys=True)
+    hit = _FILTER_CACHE.get(key)
+    if hit is None:
+        binds: Dict = {}
+        hit = (parse_filter(filter_obj, binds), binds)
+        _FILTER_CACHE[key] = hit
+    clause, binds = hit
+    return clause, dict(binds)
+
+
+def _col_alias_pairs(properties: Dict) -> List[str]:
+    """Format a property map as 'DB_COL AS "ALIAS"' expressions for SELECT."""
+    return [f'{col} AS "{alias}"' for col, alias in properties.items()]
+
+
+def _apply_date_filter(
+    where_clause: str,
+    date_col:     str,
+    binds:        Dict,
+    date_value:   Optional[str],
+    date_format:  Optional[str],
+) -> str:
+    """
+    Append the incremental cut-off filter to an existing WHERE clause.
+
+    Registers the cut-off date as the :last_upd bind; only the format string
+    (a config constant, not data) is inlined. Returns the clause unchanged
+    when no cut-off is configured.
+    """
+    if not date_value or not date_format:
+        return where_clause
+    binds["last_upd"] = date_value
+    date_filter = f"{date_col} >= TO_DATE(:last_upd, '{date_format}')"
+    return f"{where_clause} AND {date_filter}" if where_clause else date_filter
+
+
 def build_select_sql(
     node:                Dict,
     schema:              str,
     last_updated_date:   Optional[str],
     last_updated_format: Optional[str],
-) -> str:
+    use_result_cache:    bool = False,
+) -> Tuple[str, Dict]:
     """
     Build a SELECT statement to extract data for one graph node from the source DB.
 
@@ -304,7 +428,9 @@ def build_select_sql(
       - Two-table join: SELECT cols FROM schema.t1 JOIN schema.t2 ON key=key [WHERE ...]
 
     Appends an incremental LAST_UPD cut-off filter if last_updated_date is set.
-    Any structural filter defined in node["filter"] is also applied.
+    Any structural filter defined in node["filter"] is also applied. All filter
+    values (including the cut-off date) are returned as bind variables rather
+    than inlined literals, so Oracle can share one parsed cursor across runs.
 
     Parameters:
         node               : A single node dict from graph_model["nodes"].
@@ -312,45 +438,51 @@ def build_select_sql(
         last_updated_date  : Date string for incremental lower bound on LAST_UPD.
                              Pass None or empty string to skip.
         last_updated_format : Oracle TO_DATE format (e.g. 'YYYY-MM-DD'). None to skip.
+        use_result_cache   : Add the RESULT_CACHE hint so repeated re-extracts
+                             (same SQL text and binds) can be served from the
+                             server result cache instead of re-reading blocks.
 
     Returns:
-        A SQL SELECT string ready to execute against the 19c source database.
+        A (sql, binds) tuple: the SELECT string with :name placeholders and the
+        dict of bind values to pass to cursor.execute().
 
     Raises:
         NotImplementedError : If the node has more than two source tables.
     """
-
-    def col_alias_pairs(properties: Dict) -> List[str]:
-        """Format property map as 'DB_COL AS "ALIAS"' expressions for SELECT."""
-        return [f'{col} AS "{alias}"' for col, alias in properties.items()]
-
-    def apply_date_filter(where_clause: str, date_col: str) -> str:
-        """Append the incremental LAST_UPD filter to an existing WHERE clause."""
-        if not last_updated_date or not last_updated_format:
-            return where_clause
-        date_filter = (
-            f"{date_col} >= TO_DATE('{last_updated_date}', '{last_updated_format}')"
-        )
-        return f"{where_clause} AND {date_filter}" if where_clause else date_filter
-
+    if "filter" in node:
+        where, binds = _cached_filter(node["filter"])
+    else:
+        where, binds = "", {}
     tables    = node["table"]
-    cols      = ", ".join(col_alias_pairs(node["properties"]))
-    where     = parse_filter(node["filter"]) if "filter" in node else ""
-    where     = apply_date_filter(where, "LAST_UPD")
+    cols      = ", ".join(_col_alias_pairs(node["properties"]))
+    where     = _apply_date_filter(
+        where, "LAST_UPD", binds, last_updated_date, last_updated_format
+    )
     where_sql = f" WHERE {where}" if where else ""
-    #print(f"SELECT {cols} FROM {schema}.{tables[0]}{where_sql}")
+
+    # FIRST_ROWS steers the optimizer toward streaming the first batch early
+    # instead of optimizing for total throughput — it pairs with the
+    # chunk-sized fetchmany()/prefetchrows loop in the stream worker.
+    # Ordering keyed tables by ROW_ID (the indexed Siebel PK) lets the server
+    # walk the index in physical order, keeping prefetch continuity.
+    hints     = f"FIRST_ROWS({DEFAULT_CHUNK_SIZE})"
+    if use_result_cache:
+        hints = f"RESULT_CACHE {hints}"
+    hint      = f"/*+ {hints} */ "
+    order_sql = " ORDER BY ROW_ID" if "ROW_ID" in node["properties"] else ""
+
     if len(tables) == 1:
-        return f"SELECT {cols} FROM {schema}.{tables[0]}{where_sql}"
+        return f"SELECT {hint}{cols} FROM {schema}.{tables[0]}{where_sql}{order_sql}", binds
 
     if len(tables) == 2 and "join_on" in node:
         tbl1, tbl2 = tables
         left, right = next(iter(node["join_on"].items()))
         return (
-            f"SELECT {cols} "
+            f"SELECT {hint}{cols} "
             f"FROM {schema}.{tbl1} "
             f"JOIN {schema}.{tbl2} ON {left}={right}"
             f"{where_sql}"
-        )
+        ), binds
 
     raise NotImplementedError(
         f"Node '{node['name']}' has {len(tables)} tables — "
@@ -362,17 +494,52 @@ def build_select_sql(
 # Target DB — schema operations (thin mode, main process only)
 # ---------------------------------------------------------------------------
 
+# Created on first use so runs that skip every DB-touching step never connect
+_target_pool = None
+
+
+def _get_target_pool(target_config: Dict):
+    """
+    Create the thin-mode session pool for the 26ai target on first use.
+
+    main() needs target connections in up to three phases (drop, DDL apply,
+    data migration). With a pool, only the first acquire pays the TLS/wallet
+    handshake; later phases reuse a warm session. ping_interval revalidates
+    sessions idle for over a minute, e.g. while a confirmation prompt waits.
+
+    Parameters:
+        target_config : Dict of oracledb.create_pool() keyword arguments.
+
+    Returns:
+        The shared oracledb connection pool.
+    """
+    global _target_pool
+    if _target_pool is None:
+        _target_pool = oracledb.create_pool(
+            min=1,
+            max=4,
+            increment=1,
+            ping_interval=60,
+            stmtcachesize=STMT_CACHE_SIZE,
+            **target_config,
+        )
+    return _target_pool
+
+
 def connect_target(target_config: Dict):
     """
-    Open a thin-mode oracledb connection to the 26ai target database.
+    Acquire a thin-mode connection to the 26ai target from the session pool.
+
+    Closing the returned connection releases it back to the pool rather than
+    tearing down the session, so callers keep the usual connect/close shape.
 
     Parameters:
-        target_config : Dict of oracledb.connect() keyword arguments.
+        target_config : Dict of oracledb.create_pool() keyword arguments.
 
     Returns:
         An active oracledb connection.
     """
-    conn = oracledb.connect(**target_config)
+    conn = _get_target_pool(target_config).acquire()
     log.info(f"[TARGET] Connected to Oracle 26ai: {conn.version}")
     return conn
 
@@ -398,55 +565,271 @@ def drop_tables(table_names: List[str], conn) -> None:
                 log.warning(f"  [WARN] Could not drop {tbl} (may not exist): {e}")
 
 
-def execute_ddl_on_target(ddl_sql: str, conn) -> bool:
+def _iter_statements(text: str):
     """
-    Execute a DDL string statement-by-statement against the 26ai target database.
+    Yield individual SQL statements from a script, splitting on ';' only
+    when it appears outside string literals and comments.
 
-    Splits on semicolons, skips blank lines and SQL comments (-- and REM),
-    and executes each remaining statement individually. Logs success or failure
-    per statement.
+    A single forward scan tracks four states — plain text, string literal
+    (including q-quoted literals and doubled-quote escapes), line comment
+    (--) and block comment (/* */) — so a semicolon inside a literal or
+    comment never splits a statement. The previous str.split(";") approach
+    mis-split on such semicolons and its per-statement strip()/rescan work
+    was quadratic in total characters for large DDL files; this pass is
+    linear and holds only one statement at a time.
 
     Parameters:
-        ddl_sql : Full DDL string (may contain multiple statements).
-        conn    : Active oracledb connection to the target database.
+        text : Full SQL script text.
+
+    Yields:
+        Each statement stripped of surrounding whitespace, without its
+        terminating semicolon. Empty statements are skipped; trailing text
+        after the last ';' is yielded as a final statement.
+    """
+    DEFAULT, IN_STRING, IN_QSTRING, IN_LINE_COMMENT, IN_BLOCK_COMMENT = range(5)
+    qquote_close = {"[": "]", "{": "}", "<": ">", "(": ")"}
+
+    state     = DEFAULT
+    close_seq = ""
+    start     = 0
+    i, n      = 0, len(text)
+
+    while i < n:
+        ch = text[i]
+        if state == DEFAULT:
+            if ch == ";":
+                stmt = text[start:i].strip()
+                if stmt:
+                    yield stmt
+                start = i + 1
+            elif ch in "qQ" and text[i + 1 : i + 2] == "'" and i + 2 < n:
+                open_d    = text[i + 2]
+                close_seq = qquote_close.get(open_d, open_d) + "'"
+                state     = IN_QSTRING
+                i += 2
+            elif ch == "'":
+                state = IN_STRING
+            elif ch == "-" and text[i + 1 : i + 2] == "-":
+                state = IN_LINE_COMMENT
+                i += 1
+            elif ch == "/" and text[i + 1 : i + 2] == "*":
+                state = IN_BLOCK_COMMENT
+                i += 1
+        elif state == IN_STRING:
+            if ch == "'":
+                if text[i + 1 : i + 2] == "'":   # doubled '' stays inside
+                    i += 1
+                else:
+                    state = DEFAULT
+        elif state == IN_QSTRING:
+            if text[i : i + 2] == close_seq:
+                state = DEFAULT
+                i += 1
+        elif state == IN_LINE_COMMENT:
+            if ch == "\n":
+                state = DEFAULT
+        elif state == IN_BLOCK_COMMENT:
+            if ch == "*" and text[i + 1 : i + 2] == "/":
+                state = DEFAULT
+                i += 1
+        i += 1
+
+    tail = text[start:].strip()
+    if tail:
+        yield tail
+
+
+def _strip_leading_comments(stmt: str) -> str:
+    """
+    Drop leading blank, -- comment and SQL*Plus REM lines from a statement.
+
+    REM is a SQL*Plus directive, not SQL — left in place it would make the
+    dynamic EXECUTE IMMEDIATE fail with ORA-00900. Returns "" for
+    comment-only statements so callers can skip them.
+
+    Parameters:
+        stmt : A single SQL statement, possibly with leading comment lines.
+
+    Returns:
+        The statement starting at its first meaningful line.
+    """
+    lines = stmt.splitlines()
+    i = 0
+    while i < len(lines):
+        stripped = lines[i].strip()
+        if stripped and not stripped.startswith("--") and not stripped.upper().startswith("REM "):
+            break
+        i += 1
+    return "\n".join(lines[i:])
+
+
+def _first_sql_line(stmt: str) -> str:
+    """
+    Return the first non-comment line of a statement, for log labels.
+
+    Lines that are blank, -- comments or SQL*Plus REM directives are skipped.
+    Returns an empty string when the statement contains nothing else, which
+    callers use to drop comment-only statements.
+
+    Parameters:
+        stmt : A single SQL statement, possibly with leading comment lines.
+
+    Returns:
+        The first meaningful line, stripped, or "" if there is none.
+    """
+    for line in stmt.splitlines():
+        stripped = line.strip()
+        if stripped and not stripped.startswith("--") and not stripped.upper().startswith("REM "):
+            return stripped
+    return ""
+
+
+# Candidate q-quote delimiters, tried in order. The quoted statement may not
+# contain its own closing sequence (e.g. "]'"), so several pairs are offered.
+_QQUOTE_DELIMS = (("[", "]"), ("{", "}"), ("<", ">"), ("!", "!"))
+
+
+def _plsql_quote(stmt: str) -> str:
+    """
+    Wrap a SQL statement in an Oracle q-quoted literal (q'[...]').
+
+    Picks the first delimiter pair whose closing sequence does not occur in
+    the statement, so no escaping of embedded single quotes is needed.
+
+    Parameters:
+        stmt : The SQL statement text to quote.
+
+    Returns:
+        The statement as a q-quoted PL/SQL string literal.
+
+    Raises:
+        ValueError : If every candidate delimiter appears in the statement.
+    """
+    for open_d, close_d in _QQUOTE_DELIMS:
+        if f"{close_d}'" not in stmt:
+            return f"q'{open_d}{stmt}{close_d}'"
+    raise ValueError("Statement contains all candidate q-quote delimiters")
+
+
+def _execute_statements_individually(statements: List[str], conn) -> bool:
+    """
+    Fallback path: execute DDL statements one by one, logging each result.
+
+    Used only when a statement cannot be q-quoted for the batched PL/SQL
+    block. Costs one network round-trip per statement.
+
+    Parameters:
+        statements : Cleaned DDL statements (no comments, no trailing ';').
+        conn       : Active oracledb connection to the target database.
 
     Returns:
         True if all statements succeeded, False if any statement failed.
     """
-    log.info("\n-- Executing DDL in 26ai target database --")
     all_ok = True
-
     with conn.cursor() as cur:
-        for stmt in (s.strip() for s in ddl_sql.split(";") if s.strip()):
-            first_line = stmt.splitlines()[0]
-            if first_line.startswith("--") or first_line.upper().startswith("REM "):
-                continue
+        for stmt in statements:
+            first_line = _first_sql_line(stmt)
             try:
                 cur.execute(stmt)
                 log.info(f"  [OK]   {first_line[:80]}")
             except Exception as e:
                 log.error(f"  [FAIL] {first_line[:80]}\n         Error: {e}")
                 all_ok = False
-
     return all_ok
 
 
+def execute_ddl_on_target(ddl_sql: str, conn) -> bool:
+    """
+    Execute a DDL string against the 26ai target database in one round-trip.
+
+    Splits into statements with the quote- and comment-aware lexer
+    (_iter_statements), skips comment-only statements (-- and REM), then wraps all remaining statements in a single anonymous PL/SQL block of
+    EXECUTE IMMEDIATE calls. One execute() ships the whole schema instead of
+    one network round-trip per CREATE TABLE — the difference dominates on
+    WAN links to an autonomous target. Each statement runs inside its own
+    nested BEGIN/EXCEPTION so one failure does not stop the rest; failures
+    are collected server-side and logged on return.
+
+    Parameters:
+        ddl_sql : Full DDL string (may contain multiple statements).
+        conn    : Active oracledb connection to the target database.
+
+    Returns:
+        True if all statements succeeded, False if any statement failed.
+    """
+    log.info("\n-- Executing DDL in 26ai target database --")
+
+    statements = [
+        cleaned
+        for stmt in _iter_statements(ddl_sql)
+        if (cleaned := _strip_leading_comments(stmt))
+    ]
+    if not statements:
+        return True
+
+    try:
+        quoted = [_plsql_quote(s) for s in statements]
+    except ValueError:
+        # Rare: a statement embeds every delimiter — fall back to per-statement
+        return _execute_statements_individually(statements, conn)
+
+    units = []
+    for stmt, q in zip(statements, quoted):
+        label = _first_sql_line(stmt)[:80].replace("'", "''")
+        units.append(
+            "  BEGIN\n"
+            f"    EXECUTE IMMEDIATE {q};\n"
+            "  EXCEPTION WHEN OTHERS THEN\n"
+            "    l_errors := l_errors + 1;\n"
+            f"    l_msgs := SUBSTR(l_msgs || '{label}: ' || SQLERRM || CHR(10), 1, 32767);\n"
+            "  END;"
+        )
+    block = (
+        "DECLARE\n"
+        "  l_errors PLS_INTEGER := 0;\n"
+        "  l_msgs   VARCHAR2(32767) := '';\n"
+        "BEGIN\n"
+        + "\n".join(units)
+        + "\n  :errors := l_errors;"
+        "\n  :msgs   := l_msgs;"
+        "\nEND;"
+    )
+
+    with conn.cursor() as cur:
+        errors_var = cur.var(int)
+        msgs_var   = cur.var(str, 32767)
+        cur.execute(block, errors=errors_var, msgs=msgs_var)
+
+    failed = errors_var.getvalue() or 0
+    log.info(f"  [OK]   {len(statements) - failed}/{len(statements)} statements succeeded")
+    if failed:
+        for line in (msgs_var.getvalue() or "").splitlines():
+            log.error(f"  [FAIL] {line}")
+    return failed == 0
+
+
 # ---------------------------------------------------------------------------
 # Target DB — data load helpers (thin mode, main process only)
 # ---------------------------------------------------------------------------
 
-def _build_dml(node: Dict) -> str:
+def _build_dml(node: Dict, fresh: bool = False) -> str:
     """
     Build the INSERT or MERGE DML string for a node. Called once per node and
     reused for every chunk, avoiding repeated string construction.
 
     Strategy:
+      - fresh                    -> INSERT /*+ APPEND_VALUES */: direct-path
+        array insert that writes blocks above the high-water mark, bypassing
+        the buffer cache and the MERGE match plan. Fastest for first loads
+        into empty tables, but detects no conflicts and requires a commit
+        after every chunk.
       - With ROW_ID (PK present) -> MERGE: updates existing rows, inserts new ones.
         Makes migration idempotent — safe to re-run without duplicate key errors.
       - Without ROW_ID           -> plain INSERT (no conflict detection).
 
     Parameters:
-        node : A single node dict from graph_model["nodes"].
+        node  : A single node dict from graph_model["nodes"].
+        fresh : Use the direct-path INSERT even when the node has a PK.
 
     Returns:
         A parameterised DML string suitable for cursor.executemany().
@@ -457,6 +840,12 @@ def _build_dml(node: Dict) -> str:
     insert_cols = ", ".join(tgt_cols)
     pholders    = [f":{i+1}" for i in range(len(tgt_cols))]
 
+    if fresh:
+        return (
+            f"INSERT /*+ APPEND_VALUES */ INTO {table_name} ({insert_cols}) "
+            f"VALUES ({', '.join(pholders)})"
+        )
+
     if pk_col:
         # MERGE using SELECT ... FROM dual so executemany() works correctly.
         # Each bind variable becomes a named column; Oracle resolves per-row.
@@ -482,35 +871,100 @@ def _build_dml(node: Dict) -> str:
     )
 
 
+def _bind_type(value):
+    """
+    Map a sample column value to its setinputsizes() declaration.
+
+    Strings are declared as 4000-byte binds, matching the VARCHAR2(4000)
+    target DDL. Numeric and date values keep their native driver types —
+    the 19c fetch yields Python numbers/datetimes for NUMBER/DATE source
+    columns, and declaring those binds as strings would make the driver
+    reject every row with DPY-3013; Oracle converts them to VARCHAR2 on
+    insert as before. None (sample value NULL) leaves the column undeclared
+    so the driver infers its type from later chunks.
+
+    Parameters:
+        value : One column value from a sample source row.
+
+    Returns:
+        A value suitable for one setinputsizes() position.
+    """
+    if isinstance(value, str):
+        return 4000
+    if isinstance(value, (int, float, decimal.Decimal)):
+        return oracledb.DB_TYPE_NUMBER
+    if isinstance(value, datetime.date):
+        return oracledb.DB_TYPE_DATE
+    return None
+
+
+def _node_cursor(conn, sample_row):
+    """
+    Open a target cursor dedicated to one node and pre-declare its bind types.
+
+    Bind types are detected per column from the node's first fetched row
+    (see _bind_type). Declaring them once with setinputsizes() stops
+    executemany() from re-scanning every chunk to infer maximum column
+    widths and from reallocating bind buffers when widths fluctuate between
+    chunks.
+
+    Parameters:
+        conn       : Active oracledb connection to the target database.
+        sample_row : First row of the node's first chunk.
+
+    Returns:
+        A cursor ready for repeated executemany() calls against this node.
+    """
+    cur = conn.cursor()
+    cur.setinputsizes(*[_bind_type(v) for v in sample_row])
+    return cur
+
+
 def insert_chunk(
     dml:        str,
     chunk:      list,
     node_name:  str,
-    conn,
+    cur,
     chunk_num:  int,
+    do_commit:  bool = True,
 ) -> None:
     """
     Insert one chunk of rows into the target table using executemany().
 
-    Each chunk is committed immediately after insertion. If the chunk fails,
-    the transaction is rolled back and a warning is logged — other chunks
-    for the same node continue.
+    Committing every chunk bounds undo but costs one log-writer sync per
+    chunk; callers can batch commits by passing do_commit=False and
+    committing on their own cadence (see COMMIT_EVERY). Each chunk runs
+    after a SAVEPOINT, and a failure rolls back to it — discarding only the
+    failed chunk, never earlier uncommitted chunks, which matters when
+    COMMIT_EVERY holds back work from several interleaved nodes on this
+    shared connection. A warning is logged and later chunks continue.
 
     Parameters:
         dml       : Parameterised INSERT or MERGE statement.
         chunk     : List of row tuples to insert.
         node_name : Table name, used only for log messages.
-        conn      : Active oracledb connection to the target database.
+        cur       : Per-node target cursor from _node_cursor(). Reused across
+                    chunks so bind buffers and the parsed statement persist.
         chunk_num : Chunk sequence number, used only for log messages.
+        do_commit : Commit after this chunk (default True).
     """
-    with conn.cursor() as cur:
-        try:
-            cur.executemany(dml, chunk)
+    conn = cur.connection
+    try:
+        cur.execute("SAVEPOINT chunk_insert")
+        cur.executemany(dml, chunk)
+        if do_commit:
             conn.commit()
-            log.info(f"  [CHUNK {chunk_num}] Inserted {len(chunk):,} rows -> {node_name}")
-        except Exception as e:
-            conn.rollback()
-            log.warning(f"  [WARN]  Chunk {chunk_num} failed for '{node_name}': {e}")
+        # Per-chunk lines are DEBUG — at INFO a large node would emit one
+        # stdout write per chunk. Progress surfaces every 100 chunks instead.
+        log.debug(f"  [CHUNK {chunk_num}] Inserted {len(chunk):,} rows -> {node_name}")
+        if chunk_num % 100 == 0:
+            log.info(f"  [PROGRESS] {node_name}: {chunk_num} chunks loaded")
+    except Exception as e:
+        try:
+            cur.execute("ROLLBACK TO SAVEPOINT chunk_insert")
+        except Exception:
+            conn.rollback()   # session-level failure — full rollback as last resort
+        log.warning(f"  [WARN]  Chunk {chunk_num} failed for '{node_name}': {e}")
 
 
 # ---------------------------------------------------------------------------
@@ -546,26 +1000,30 @@ def _stream_worker(
     Parameters:
         source_config      : Dict of oracledb.connect() kwargs for the 19c DB.
         oracle_client_path : Path to Oracle Instant Client libs for thick mode.
-        queries            : List of (node_name, sql) tuples to execute.
+        queries            : List of (node_name, sql, binds) tuples to execute.
         queue              : Shared multiprocessing.Queue for result streaming.
         chunk_size         : Number of rows per fetchmany() call and queue message.
     """
     try:
         oracledb.init_oracle_client(lib_dir=oracle_client_path)
-        conn = oracledb.connect(**source_config)
+        conn = oracledb.connect(stmtcachesize=STMT_CACHE_SIZE, **source_config)
         log.info(f"[SOURCE] Connected to Oracle 19c: {conn.version}")
     except Exception as e:
         queue.put(("fatal", None, str(e)))
         return
 
-    for node_name, sql in queries:
+    for node_name, sql, binds in queries:
         total = 0
         try:
             with conn.cursor() as cur:
                 # arraysize = chunk_size reduces network round-trips from
-                # (total_rows / 100) to (total_rows / chunk_size)
-                cur.arraysize = chunk_size
-                cur.execute(sql)
+                # (total_rows / 100) to (total_rows / chunk_size).
+                # prefetchrows must be tuned together with arraysize, otherwise
+                # the first fetch still uses Oracle's default prefetch of 2 and
+                # pays an extra round-trip per batch.
+                cur.arraysize    = chunk_size
+                cur.prefetchrows = chunk_size + 1
+                cur.execute(sql, binds)
                 while True:
                     chunk = cur.fetchmany(chunk_size)
                     if not chunk:
@@ -591,78 +1049,117 @@ def stream_and_load(
     graph_model:        Dict,
     target_config:      Dict,
     chunk_size:         int,
+    num_workers:        int = 1,
+    commit_every:       int = 1,
+    fresh:              bool = False,
 ) -> None:
     """
-    Spawn the source-fetch child process and consume its output stream,
-    writing each chunk to the 26ai target immediately.
+    Spawn one or more source-fetch child processes and consume their merged
+    output stream, writing each chunk to the 26ai target immediately.
 
     Memory profile: at most two chunks exist simultaneously — one in the queue
     and one being inserted — regardless of total row count.
 
-    Back-pressure: Queue(maxsize=20) causes the child to block once 20 chunks
-    are queued, preventing it from racing too far ahead of the main process and
-    accumulating unbounded memory.
+    Back-pressure: Queue(maxsize=20) causes the children to block once 20
+    chunks are queued, preventing them from racing too far ahead of the main
+    process and accumulating unbounded memory.
 
     Parameters:
         source_config      : Connection kwargs for the 19c source DB.
         oracle_client_path : Path to Oracle Instant Client for thick mode.
-        queries            : List of (node_name, sql) tuples to stream.
+        queries            : List of (node_name, sql, binds) tuples to stream.
         graph_model        : Full graph model dict (used to build DML per node).
         target_config      : Connection kwargs for the 26ai target DB.
         chunk_size         : Rows per chunk (controls memory and throughput).
+        num_workers        : Number of source-reader child processes. Queries
+                             are dealt round-robin across workers so several
+                             nodes stream concurrently; inserts stay
+                             serialised on the single target connection.
+        commit_every       : Commit the target after this many chunks per
+                             node (default 1). Larger values amortise the
+                             log-writer sync on big loads; any remainder is
+                             committed when the node finishes.
+        fresh              : First-run load — use direct-path INSERT instead
+                             of MERGE. Forces a commit per chunk, since a
+                             direct-path insert leaves the segment unusable
+                             for further DML until committed (ORA-12838).
     """
     node_lookup = {node["name"]: node for node in graph_model["nodes"]}
 
-    # maxsize=20 applies back-pressure so the child cannot run unboundedly ahead
+    if fresh:
+        commit_every = 1   # each direct-path chunk must commit before the next
+
+    # maxsize=20 applies back-pressure so the children cannot run unboundedly ahead
+    num_workers = max(1, min(num_workers, len(queries) or 1))
     queue = multiprocessing.Queue(maxsize=20)
-    proc  = multiprocessing.Process(
-        target=_stream_worker,
-        args=(source_config, oracle_client_path, queries, queue, chunk_size),
-    )
-    proc.start()
+    procs = [
+        multiprocessing.Process(
+            target=_stream_worker,
+            args=(source_config, oracle_client_path, queries[i::num_workers], queue, chunk_size),
+        )
+        for i in range(num_workers)
+    ]
+    for proc in procs:
+        proc.start()
 
     tgt_conn       = connect_target(target_config)
     dml_cache      = {}   # node_name -> pre-built DML (built once, reused per chunk)
+    cursor_cache   = {}   # node_name -> dedicated cursor with pre-declared binds
     chunk_counters = {}   # node_name -> chunk sequence number for logging
 
     try:
-        while True:
-            msg  = queue.get()   # blocks until child sends a message
+        finished = 0
+        while finished < len(procs):
+            msg  = queue.get()   # blocks until a child sends a message
             kind = msg[0]
 
             if kind == "sentinel":
-                # Child has finished all queries — safe to exit the loop
-                break
+                # One child has finished all its queries
+                finished += 1
+                continue
 
             if kind == "fatal":
+                # The child exits right after sending "fatal", so count it as
+                # finished and keep draining the others' messages.
                 log.critical(f"[FATAL] Source connection failed: {msg[2]}")
-                break
+                finished += 1
+                continue
 
             node_name = msg[1]
 
             if kind == "data":
                 chunk = msg[2]
                 if node_name not in dml_cache:
-                    dml_cache[node_name]      = _build_dml(node_lookup[node_name])
+                    dml_cache[node_name]      = _build_dml(node_lookup[node_name], fresh)
+                    cursor_cache[node_name]   = _node_cursor(tgt_conn, chunk[0])
                     chunk_counters[node_name] = 0
                 chunk_counters[node_name] += 1
                 insert_chunk(
                     dml_cache[node_name],
                     chunk,
                     node_name,
-                    tgt_conn,
+                    cursor_cache[node_name],
                     chunk_counters[node_name],
+                    do_commit=(chunk_counters[node_name] % commit_every == 0),
                 )
 
             elif kind == "done":
+                tgt_conn.commit()   # flush any chunks held back by commit_every
                 log.info(f"  [DONE] {node_name}: {msg[2]:,} total rows migrated.")
 
             elif kind == "error":
                 log.error(f"  [ERROR] {node_name} fetch failed: {msg[2]}")
 
     finally:
+        try:
+            tgt_conn.commit()   # connection close would roll back pending chunks
+        except Exception:
+            pass
+        for cur in cursor_cache.values():
+            cur.close()
         tgt_conn.close()
-        proc.join()
+        for proc in procs:
+            proc.join()
 
 
 # ---------------------------------------------------------------------------
@@ -689,7 +1186,9 @@ def main() -> None:
         chunk into the 26ai target as it arrives.
 
     All database-touching steps are gated behind interactive prompts and can
-    be skipped safely without affecting other steps.
+    be skipped safely without affecting other steps. Passing --yes runs
+    unattended: the destructive DROP step is skipped, DDL apply and data
+    migration are approved.
     """
     log.info("=" * 70)
     log.info("Oracle 19c -> 26ai Property Graph Migration")
@@ -714,6 +1213,9 @@ def main() -> None:
     last_updated_date   = config.get("QUERY_DATE")
     last_updated_format = config.get("DATE_FORMAT")
     chunk_size          = int(config.get("BATCH_SIZE", DEFAULT_CHUNK_SIZE))
+    num_workers         = int(config.get("SOURCE_WORKERS", 1))
+    commit_every        = max(1, int(config.get("COMMIT_EVERY", 1)))
+    use_result_cache    = bool(config.get("USE_RESULT_CACHE"))
     oracle_client_path  = config.get("19C_CLIENT_PATH")
 
     source_config = {
@@ -735,19 +1237,27 @@ def main() -> None:
     if not graph_model_path.exists():
         raise FileNotFoundError(f"Graph model not found: {graph_model_path}")
 
-    with graph_model_path.open() as f:
-        graph_model = json.load(f)
-
-    ddl_sql = generate_ddl(graph_model)
-    ddl_output_path.write_text(ddl_sql)
-    #log.info(ddl_sql)
+    graph_model = _load_json(graph_model_path)
+
+    # Stream block-by-block to a temp file, then swap it into place so the
+    # output is always either the previous version or a complete new one.
+    tmp_path = f"{ddl_output_path}.tmp"
+    with open(tmp_path, "w") as f:
+        for i, block in enumerate(iter_ddl(graph_model)):
+            if i:
+                f.write("\n\n")
+            f.write(block)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, ddl_output_path)
     log.info(f"\n  DDL written to: {ddl_output_path}")
 
     table_names = [node["name"] for node in graph_model["nodes"]]
 
     # -- Step 2a: Optional DROP ----------------------------------------------
+    # Destructive, so --yes deliberately skips it rather than auto-approving.
     log.info("\n[STEP 2] Schema apply ...")
-    if input(
+    if not args.yes and input(
         "Drop ALL target tables in 26ai DB before CREATE? Type 'drop' to confirm: "
     ).strip().lower() == "drop":
         log.info("  Connecting to 26ai target DB to drop tables ...")
@@ -764,7 +1274,7 @@ def main() -> None:
                 pass
 
     # -- Step 2b: Apply DDL --------------------------------------------------
-    if input(
+    if args.yes or input(
         "Execute the generated DDL in the 26ai target database? Type 'yes' to approve: "
     ).strip().lower() == "yes":
         log.info("  Connecting to 26ai target DB to apply DDL ...")
@@ -774,7 +1284,7 @@ def main() -> None:
             log.error(f"  [FAIL] Could not connect to 26ai DB: {e}")
             return
 
-        ok = execute_ddl_on_target(ddl_sql, tgt_conn)
+        ok = execute_ddl_on_target(ddl_output_path.read_text(), tgt_conn)
         tgt_conn.close()
 
         if ok:
@@ -786,7 +1296,7 @@ def main() -> None:
 
     # -- Step 3: Data migration ----------------------------------------------
     log.info("\n[STEP 3] Data migration ...")
-    if input(
+    if not args.yes and input(
         "Migrate data from 19c source to 26ai target? Type 'migrate' to approve: "
     ).strip().lower() != "migrate":
         log.info("  Data migration skipped.")
@@ -796,8 +1306,10 @@ def main() -> None:
     queries = []
     for node in graph_model["nodes"]:
         try:
-            sql = build_select_sql(node, schema, last_updated_date, last_updated_format)
-            queries.append((node["name"], sql))
+            sql, binds = build_select_sql(
+                node, schema, last_updated_date, last_updated_format, use_result_cache
+            )
+            queries.append((node["name"], sql, binds))
             #log.info(f"  [SQL] {node['name']}: {sql[:120]}")
         except Exception as e:
             log.warning(f"  [WARN] Could not build SQL for '{node['name']}': {e}")
@@ -810,6 +1322,9 @@ def main() -> None:
         graph_model        = graph_model,
         target_config      = target_config,
         chunk_size         = chunk_size,
+        num_workers        = num_workers,
+        commit_every       = commit_every,
+        fresh              = args.fresh,
     )
 
     log.info("\n[DONE] Migration complete.")